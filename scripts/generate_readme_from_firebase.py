@@ -1,18 +1,28 @@
 #!/usr/bin/env python3
+import functools
 import math
 import os
+import socket
 import sys
 import json
 import logging
+import threading
+from operator import itemgetter
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
+from zoneinfo import ZoneInfo
 
-import pytz
 import firebase_admin
 from firebase_admin import credentials, firestore
+from google.api_core import retry
+from google.api_core.exceptions import Aborted, DeadlineExceeded, ResourceExhausted, ServiceUnavailable
 from slugify import slugify
 import requests
 from urllib.parse import urlparse
+from requests.adapters import HTTPAdapter
 from requests.exceptions import RequestException
+from urllib3.exceptions import NameResolutionError
+from urllib3.util.retry import Retry
 
 # Set up logging
 logging.basicConfig(
@@ -27,9 +37,89 @@ logger = logging.getLogger(__name__)
 # Constants
 REQUIRED_ENV_VARS = ['GCP_SA_KEY', 'FIREBASE_PROJECT_ID', 'FIREBASE_PLATFORM_COLLECTION']
 DEFAULT_TIMEOUT = 30
+CONNECT_TIMEOUT = 5
 MAX_REDIRECTS = 5
+URL_CHECK_WORKERS = 64
+FIRESTORE_BATCH_SIZE = 500
+FIRESTORE_PAGE_SIZE = 500
+# Platform metrics that rank platforms within a category, most significant first
+SORT_METRICS = ('importance', 'usefulness', 'beginner_friendly')
+# Platform fields read by the README generator and URL health check
+PROJECTED_FIELDS = [
+    'name', 'url', 'category', 'description', 'pricing_url', 'quick_start_url',
+    'free_tier_details', 'key_features', 'monetization_options',
+    'importance', 'usefulness', 'beginner_friendly'
+]
+README_BUFFER_SIZE = 1 << 20
+# US Eastern time for the "Last updated" stamp (canonical name for US/Eastern)
+EASTERN_TIMEZONE = ZoneInfo('America/New_York')
 USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
 
+# Shared HTTP session so URL checks reuse pooled keep-alive connections
+# instead of paying a TCP+TLS handshake per URL.
+SESSION = requests.Session()
+SESSION.max_redirects = MAX_REDIRECTS
+SESSION.headers.update({
+    'User-Agent': USER_AGENT,
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.5',
+    'Connection': 'keep-alive',
+})
+_adapter = HTTPAdapter(
+    pool_connections=URL_CHECK_WORKERS,
+    pool_maxsize=URL_CHECK_WORKERS,
+    max_retries=Retry(total=2, read=0, backoff_factor=0.3)
+)
+SESSION.mount('https://', _adapter)
+SESSION.mount('http://', _adapter)
+
+# Hosts whose servers reject or drop HEAD requests; checked with GET only
+HEAD_UNSUPPORTED_HOSTS = set()
+
+# Transient Firestore commit failures are retried with exponential backoff;
+# batched deletes are idempotent, so replaying a commit is safe
+FIRESTORE_COMMIT_RETRY = retry.Retry(
+    predicate=retry.if_exception_type(Aborted, DeadlineExceeded, ResourceExhausted, ServiceUnavailable),
+    initial=1.0,
+    maximum=30.0,
+    multiplier=2.0,
+    timeout=120.0
+)
+
+# Host-wide verdicts shared by the URL check worker threads: True once any URL
+# on the host answered, False only when DNS says the name does not exist
+_HOST_STATUS = {}
+_HOST_STATUS_LOCK = threading.Lock()
+
+# Resolver answers meaning the name definitely does not exist
+_DNS_NOT_FOUND_ERRORS = {socket.EAI_NONAME, getattr(socket, 'EAI_NODATA', socket.EAI_NONAME)}
+
+# Category emojis, matched exactly first and then by keyword
+_EMOJI_MAP = {
+    'Freelancing': '💼',
+    'Content Creation': '📝',
+    'E-commerce': '🛍️',
+    'AI Services': '🤖',
+    'Digital Products': '📦',
+    'Online Services': '🌐',
+    'Education': '📚',
+    'Investing': '💰',
+    'Gaming': '🎮',
+    'Social Media': '📱',
+    'Development': '👨‍💻',
+    'Design': '🎨',
+    'Writing': '✍️',
+    'Marketing': '📢',
+    'Tutoring': '👨‍🏫',
+    'Translation': '🌍',
+    'Data Entry': '📊',
+    'Virtual Assistant': '👩‍💼',
+    'Customer Service': '🎯',
+    'Research': '🔍',
+    'Uncategorized': '📌'
+}
+_EMOJI_KEYWORDS = [(keyword.lower(), emoji) for keyword, emoji in _EMOJI_MAP.items()]
+
 def validate_environment_vars():
     """Validate that all required environment variables are set."""
     missing_vars = [var for var in REQUIRED_ENV_VARS if not os.environ.get(var)]
@@ -40,68 +130,137 @@ def initialize_firebase():
     """Initialize Firebase with proper error handling."""
     try:
         validate_environment_vars()
-        service_account_info = json.loads(os.environ['GCP_SA_KEY'])
-        cred = credentials.Certificate(service_account_info)
+        gcp_sa_key = os.environ['GCP_SA_KEY']
+        # GCP_SA_KEY holds either the service account JSON or a path to the key file
+        if os.path.isfile(gcp_sa_key):
+            cred = credentials.Certificate(gcp_sa_key)
+        else:
+            cred = credentials.Certificate(json.loads(gcp_sa_key))
         firebase_admin.initialize_app(cred)
         return firestore.client()
     except Exception as e:
         logger.error(f"Error initializing Firebase: {str(e)}")
         raise
 
+def iter_platform_documents(collection_ref, page_size=FIRESTORE_PAGE_SIZE):
+    """Yield projected platform snapshots in document-id order, one keyset page at a time."""
+    query = collection_ref.select(PROJECTED_FIELDS).order_by('__name__').limit(page_size)
+    last_snapshot = None
+    while True:
+        page_query = query.start_after(last_snapshot) if last_snapshot else query
+        page_count = 0
+        for snapshot in page_query.stream():
+            page_count += 1
+            last_snapshot = snapshot
+            yield snapshot
+        if page_count < page_size:
+            return
+
 def get_platforms_from_firebase(db):
-    """Retrieve all platforms from Firebase and organize them by category."""
+    """
+    Retrieve all platforms from Firebase and organize them by category.
+    Returns the platforms grouped by category and the per-category counts,
+    both built in the same pass over the stream.
+    """
     try:
         collection_ref = db.collection(os.environ['FIREBASE_PLATFORM_COLLECTION'])
-        platforms = collection_ref.stream()
+        platforms = iter_platform_documents(collection_ref)
         
         categorized_platforms = {}
+        category_counts = {}
         for platform in platforms:
             data = platform.to_dict()
+            data['id'] = platform.id
+            # Fill sort metrics once so the per-category sort can use itemgetter
+            for metric in SORT_METRICS:
+                data.setdefault(metric, 0)
+            # Normalize key_features to a list so formatting needs no type checks
+            features = data.get('key_features')
+            data['key_features'] = features if isinstance(features, list) else ([str(features)] if features else [])
             category = data.get('category', 'Uncategorized')
             categorized_platforms.setdefault(category, []).append(data)
+            category_counts[category] = category_counts.get(category, 0) + 1
         
-        return categorized_platforms
+        return categorized_platforms, category_counts
     except Exception as e:
         logger.error(f"Error retrieving platforms from Firebase: {str(e)}")
         raise
 
-def check_url_health(url, timeout=DEFAULT_TIMEOUT, max_redirects=MAX_REDIRECTS):
+def _normalize_url(url):
+    """Add an https:// scheme to URLs stored without one."""
+    if not urlparse(url).scheme:
+        return 'https://' + url
+    return url
+
+def check_url_health(url, session=SESSION, timeout=DEFAULT_TIMEOUT):
     """
     Check if a URL is accessible with robust redirect handling and error checking.
+    Requests go through the given session so pooled connections are reused, and
+    each normalized URL is only checked once per run.
     Returns True if accessible, False otherwise.
     """
     try:
-        if not urlparse(url).scheme:
-            url = 'https://' + url
+        url = _normalize_url(url)
+    except Exception as e:
+        logger.warning(f"Unexpected error checking URL {url}: {str(e)}")
+        return False
+    return _check_url_health_cached(url, session, timeout)
 
-        session = requests.Session()
-        session.max_redirects = max_redirects
-        
-        headers = {
-            'User-Agent': USER_AGENT,
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5',
-            'Connection': 'keep-alive',
-        }
-
-        for method in ['HEAD', 'GET']:
+@functools.lru_cache(maxsize=4096)
+def _check_url_health_cached(url, session, timeout):
+    """Check a normalized URL, reusing host-wide verdicts; see check_url_health."""
+    try:
+        parsed_url = urlparse(url)
+        host = parsed_url.netloc.lower()
+    except ValueError as e:
+        logger.warning(f"Invalid URL {url}: {str(e)}")
+        return False
+
+    with _HOST_STATUS_LOCK:
+        if host in _HOST_STATUS:
+            return _HOST_STATUS[host]
+
+    healthy = _probe_url(url, host, session, timeout)
+    if healthy:
+        with _HOST_STATUS_LOCK:
+            _HOST_STATUS[host] = True
+    return healthy
+
+def _is_unknown_host(error):
+    """Return True if a requests error is DNS saying the host does not exist."""
+    reason = getattr(error.args[0], 'reason', None) if error.args else None
+    if not isinstance(reason, NameResolutionError):
+        return False
+    cause = reason.__cause__
+    return isinstance(cause, socket.gaierror) and cause.errno in _DNS_NOT_FOUND_ERRORS
+
+def _probe_url(url, host, session, timeout):
+    """Request a URL with HEAD, falling back to GET; True if the server answers."""
+    try:
+        # Hosts that already failed a HEAD request go straight to GET
+        methods = ['GET'] if host in HEAD_UNSUPPORTED_HOSTS else ['HEAD', 'GET']
+
+        for method in methods:
             try:
-                response = session.request(
+                # HEAD has no body, so its connection goes back to the pool; GET
+                # streams so the body is never downloaded (that socket is closed)
+                with session.request(
                     method=method,
                     url=url,
-                    headers=headers,
-                    timeout=timeout,
+                    timeout=(CONNECT_TIMEOUT, timeout),
                     allow_redirects=True,
-                    verify=True
-                )
+                    verify=True,
+                    stream=(method == 'GET')
+                ) as response:
+                    status_code = response.status_code
                 
-                if response.status_code < 500:
+                if status_code < 500:
                     return True
                     
-                if response.status_code == 405:
+                if status_code == 405:
                     continue
                     
-                logger.warning(f"URL {url} returned status code {response.status_code}")
+                logger.warning(f"URL {url} returned status code {status_code}")
                 return False
                 
             except (requests.exceptions.TooManyRedirects, requests.exceptions.SSLError) as e:
@@ -109,6 +268,14 @@ def check_url_health(url, timeout=DEFAULT_TIMEOUT, max_redirects=MAX_REDIRECTS):
                 return False
             except (requests.exceptions.ConnectionError, requests.exceptions.Timeout,
                    requests.exceptions.RequestException) as e:
+                if _is_unknown_host(e):
+                    # The name does not exist, so no URL on this host can work
+                    logger.warning(f"Host for {url} does not resolve")
+                    with _HOST_STATUS_LOCK:
+                        _HOST_STATUS[host] = False
+                    return False
+                if method == 'HEAD':
+                    HEAD_UNSUPPORTED_HOSTS.add(host)
                 continue
         
         logger.warning(f"All methods failed for {url}")
@@ -119,10 +286,26 @@ def check_url_health(url, timeout=DEFAULT_TIMEOUT, max_redirects=MAX_REDIRECTS):
         return False
 
 def remove_invalid_platforms(db, platforms_by_category):
-    """Check URLs and remove platforms with invalid URLs from Firebase."""
+    """
+    Check URLs and remove platforms with invalid URLs from Firebase.
+    Returns the remaining platforms by category and their per-category counts.
+    """
     collection_ref = db.collection(os.environ['FIREBASE_PLATFORM_COLLECTION'])
     updated_platforms = {}
+    category_counts = {}
     removed_count = 0
+    batch = db.batch()
+    pending_removals = []
+
+    # Check all URLs concurrently; the work is network-bound so wall time is
+    # bounded by the slowest hosts rather than the sum of all round-trips.
+    urls = {platform.get('url') for platforms in platforms_by_category.values()
+            for platform in platforms if platform.get('url')}
+    url_health = {}
+    with ThreadPoolExecutor(max_workers=URL_CHECK_WORKERS) as executor:
+        future_to_url = {executor.submit(check_url_health, url, SESSION): url for url in urls}
+        for future in as_completed(future_to_url):
+            url_health[future_to_url[future]] = future.result()
 
     for category, platforms in platforms_by_category.items():
         valid_platforms = []
@@ -132,40 +315,103 @@ def remove_invalid_platforms(db, platforms_by_category):
                 logger.warning(f"Platform {platform.get('name')} has no URL, skipping...")
                 continue
 
-            if check_url_health(url):
+            if url_health[url]:
                 valid_platforms.append(platform)
             else:
-                try:
-                    platform_id = platform.get('id')
-                    if platform_id:
-                        collection_ref.document(platform_id).delete()
-                        removed_count += 1
-                        logger.info(f"Removed invalid platform: {platform.get('name')} ({url})")
-                except Exception as e:
-                    logger.error(f"Error removing platform {platform.get('name')}: {str(e)}")
+                platform_id = platform.get('id')
+                if platform_id:
+                    try:
+                        batch.delete(collection_ref.document(platform_id))
+                    except Exception as e:
+                        logger.error(f"Error removing platform {platform.get('name')}: {str(e)}")
+                        continue
+                    pending_removals.append(platform)
+                    if len(pending_removals) == FIRESTORE_BATCH_SIZE:
+                        removed_count += commit_removals(batch, pending_removals)
+                        batch = db.batch()
+                        pending_removals = []
 
         if valid_platforms:
             updated_platforms[category] = valid_platforms
+            category_counts[category] = len(valid_platforms)
+
+    if pending_removals:
+        removed_count += commit_removals(batch, pending_removals)
 
     if removed_count > 0:
         logger.info(f"Removed {removed_count} platforms with invalid URLs")
     
-    return updated_platforms
+    return updated_platforms, category_counts
+
+def commit_removals(batch, platforms):
+    """Commit a batch of platform deletes; returns how many were removed."""
+    try:
+        batch.commit(retry=FIRESTORE_COMMIT_RETRY)
+    except Exception as e:
+        names = ', '.join(str(platform.get('name')) for platform in platforms)
+        logger.error(f"Error removing platforms {names}: {str(e)}")
+        return 0
+
+    for platform in platforms:
+        logger.info(f"Removed invalid platform: {platform.get('name')} ({platform.get('url')})")
+    return len(platforms)
 
 def format_list_items(items):
     """Format a list of items as HTML bullet points."""
-    if isinstance(items, list):
-        return "<br>• ".join([""] + items)
-    return str(items)
+    return "<br>• " + "<br>• ".join(items) if items else ""
+
+def escape_pipes(text):
+    """Escape pipes so user text cannot break the Markdown table."""
+    # Most cells have no pipes; the membership test skips building a copy
+    if '|' not in text:
+        return text
+    return text.replace('|', '\\|')
+
+def format_table_cells(platform):
+    """Format every README table cell for a platform except the rank."""
+    # Bind the lookup once; every cell below reads from the platform dict
+    get = platform.get
+
+    # Format platform data
+    key_features = format_list_items(get('key_features', []))
+    platform_name = platform['name']
+    platform_url = platform['url'].replace('&', '&amp;')
+
+    # Format additional URLs with emojis
+    additional_urls = []
+    pricing_url = get('pricing_url')
+    if pricing_url:
+        additional_urls.append(f"[(💰 pricing)]({pricing_url})")
+    quick_start_url = get('quick_start_url')
+    if quick_start_url:
+        additional_urls.append(f"[(🚀 quick start)]({quick_start_url})")
+
+    # Only user-supplied cells can contain pipes, so only those are escaped
+    link = escape_pipes(f"[{platform_name}]({platform_url})")
+    summary = escape_pipes(f"{get('description', '')} {' '.join(additional_urls)}")
+    free_tier = escape_pipes(str(get('free_tier_details', '')))
+    key_features = escape_pipes(key_features)
+    monetization = escape_pipes(str(get('monetization_options', '')))
+    rating = format_rating(get('importance'))
+    return f"{link} | {summary} | {free_tier} | {key_features} | {monetization} | {rating}"
+
+def iter_readme_lines(platforms_by_category, category_counts):
+    """Yield the README.md lines from the platform data with SEO optimization."""
+    current_est_time = datetime.now(EASTERN_TIMEZONE).strftime("%Y-%m-%d %H:%M:%S")
 
-def generate_readme_content(platforms_by_category):
-    """Generate the README.md content from the platform data with SEO optimization."""
-    current_est_time = datetime.now(pytz.timezone('US/Eastern')).strftime("%Y-%m-%d %H:%M:%S")
-
-    # Calculate item counts for each category
-    category_counts = {category: len(platforms) for category, platforms in platforms_by_category.items()}
     total_platforms = sum(category_counts.values())
     total_platforms_rounded = math.floor(total_platforms / 100) * 100
+    # Largest categories first; ties are listed alphabetically. Emoji and
+    # anchor are resolved in the same pass and shared by TOC and sections.
+    sorted_categories = tuple(
+        (
+            category,
+            item_count,
+            get_category_emoji(category),
+            '-' + slugify(category.replace('&', '_amp_')).replace('-amp-', '--')
+        )
+        for category, item_count in sorted(category_counts.items(), key=lambda item: (-item[1], item[0]))
+    )
 
     # SEO-optimized badges and metadata
     badges = f"""
@@ -195,7 +441,7 @@ def generate_readme_content(platforms_by_category):
     """
 
     # Start building content
-    content = [
+    yield from [
         description,
         "",
         f"Last updated: {current_est_time} EST",
@@ -205,12 +451,10 @@ def generate_readme_content(platforms_by_category):
     ]
 
     # Add table of contents with emojis and counts
-    for category, item_count in sorted(category_counts.items(), key=lambda x: (x[1], x[0]), reverse=True):
-        anchor = '-' +slugify(category.replace('&', '_amp_')).replace('-amp-', '--')
-        emoji = get_category_emoji(category)
-        content.append(f"- [{emoji} {category} ({item_count})](#{anchor})")
+    for category, item_count, emoji, anchor in sorted_categories:
+        yield f"- [{emoji} {category} ({item_count})](#{anchor})"
     
-    content.extend([
+    yield from [
         "",
         "## 📚 How to Use This List",
         "",
@@ -220,72 +464,38 @@ def generate_readme_content(platforms_by_category):
         "",
         "## ⭐ Top Categories",
         ""
-    ])
+    ]
 
     # Add category sections with enhanced formatting
-    for category, item_count in sorted(category_counts.items(), key=lambda x: (x[1], x[0]), reverse=True):
+    for category, item_count, emoji, _ in sorted_categories:
         platforms = platforms_by_category[category]
         if not platforms:
             continue
 
-        emoji = get_category_emoji(category)
-        content.extend([
+        yield from [
             f"## {emoji} {category}",
             "",
             f"*{item_count} platforms in this category*",
             "",
             "Rank | Platform | Description | Free Tier | Key Features | Monetization | Importance |",
             "-----|----------|-------------|-----------|--------------|--------------|------------|"
-        ])
+        ]
 
         # Sort platforms by importance and other metrics
-        sorted_platforms = sorted(
-            platforms,
-            key=lambda x: (
-                x.get('importance', 0),
-                x.get('usefulness', 0),
-                x.get('beginner_friendly', 0)
-            ),
-            reverse=True
-        )
+        sorted_platforms = sorted(platforms, key=itemgetter(*SORT_METRICS), reverse=True)
 
         for rank, platform in enumerate(sorted_platforms, start=1):
             try:
-                # Format platform data
-                key_features = format_list_items(platform.get('key_features', []))
-                platform_name = platform['name']
-                platform_url = platform['url'].replace('&', '&amp;')
-                
-                # Format additional URLs with emojis
-                additional_urls = []
-                if platform.get('pricing_url'):
-                    additional_urls.append(f"[(💰 pricing)]({platform['pricing_url']})")
-                if platform.get('quick_start_url'):
-                    additional_urls.append(f"[(🚀 quick start)]({platform['quick_start_url']})")
-                
-                # Create row with enhanced formatting
-                row = [
-                    f"**{rank}**",
-                    f"[{platform_name}]({platform_url})",
-                    f"{platform.get('description', '')} {' '.join(additional_urls)}",
-                    platform.get('free_tier_details', ''),
-                    key_features,
-                    platform.get('monetization_options', ''),
-                    format_rating(platform.get('importance'))
-                ]
-                
-                # Escape pipes and join
-                row = [str(cell).replace('|', '\\|') for cell in row]
-                content.append("| " + " | ".join(row) + " |")
+                yield f"| **{rank}** | {format_table_cells(platform)} |"
                 
             except Exception as e:
                 logger.error(f"Error processing platform {platform.get('name', 'Unknown')}: {str(e)}")
                 continue
 
-        content.append("")
+        yield ""
 
     # Add footer with SEO-optimized content
-    content.extend([
+    yield from [
         "## 📈 Contributing",
         "",
         "Found a great platform? [Submit a pull request](https://github.com/kevinchwong/awesome-money-platforms/pulls) or [open an issue](https://github.com/kevinchwong/awesome-money-platforms/issues) to suggest additions.",
@@ -301,40 +511,19 @@ def generate_readme_content(platforms_by_category):
         "## ⭐ Star History",
         "",
         "[![Star History Chart](https://api.star-history.com/svg?repos=kevinchwong/awesome-money-platforms&type=Date)](https://star-history.com/#kevinchwong/awesome-money-platforms&Date)"
-    ])
-
-    return "\n".join(content)
+    ]
 
 def get_category_emoji(category):
     """Get appropriate emoji for category."""
-    emoji_map = {
-        'Freelancing': '💼',
-        'Content Creation': '📝',
-        'E-commerce': '🛍️',
-        'AI Services': '🤖',
-        'Digital Products': '📦',
-        'Online Services': '🌐',
-        'Education': '📚',
-        'Investing': '💰',
-        'Gaming': '🎮',
-        'Social Media': '📱',
-        'Development': '👨‍💻',
-        'Design': '🎨',
-        'Writing': '✍️',
-        'Marketing': '📢',
-        'Tutoring': '👨‍🏫',
-        'Translation': '🌍',
-        'Data Entry': '📊',
-        'Virtual Assistant': '👩‍💼',
-        'Customer Service': '🎯',
-        'Research': '🔍',
-        'Uncategorized': '📌'
-    }
+    # exact category names hit the map directly
+    emoji = _EMOJI_MAP.get(category)
+    if emoji:
+        return emoji
     # mapping by keywords matching
-    for keyword, emoji in emoji_map.items():
-        if keyword and emoji:
-            if keyword.lower() in category.lower():
-                return emoji
+    category_lower = category.lower()
+    for keyword, emoji in _EMOJI_KEYWORDS:
+        if keyword in category_lower:
+            return emoji
     return '📌'
 
 def format_rating(rating):
@@ -345,27 +534,29 @@ def format_rating(rating):
     return f"{stars} ({rating}/5)"
 
 def update_readme(content):
-    """Update the README.md file."""
+    """Update the README.md file from an iterable of lines."""
     try:
-        with open("README.md", "w") as f:
-            f.write(content)
-            logger.info("README.md has been updated successfully!")
+        # Write to a temporary file so a failure part-way leaves README.md intact
+        with open("README.md.tmp", "w", encoding="utf-8", newline="\n", buffering=README_BUFFER_SIZE) as f:
+            f.writelines(line + "\n" for line in content)
+        os.replace("README.md.tmp", "README.md")
+        logger.info("README.md has been updated successfully!")
     except Exception as e:
         logger.error(f"Error updating README.md: {str(e)}")
+        if os.path.exists("README.md.tmp"):
+            os.remove("README.md.tmp")
         raise
 
 def main():
     """Main function to generate README from Firebase data."""
     try:
         db = initialize_firebase()
-        platforms_by_category = get_platforms_from_firebase(db)
+        platforms_by_category, category_counts = get_platforms_from_firebase(db)
         
         # Uncomment to enable URL health checking
-        # platforms_by_category = remove_invalid_platforms(db, platforms_by_category)
+        # platforms_by_category, category_counts = remove_invalid_platforms(db, platforms_by_category)
         
-        readme_content = generate_readme_content(platforms_by_category)
-        logger.info(f"Generated README content with size: {len(readme_content)}")
-        update_readme(readme_content)
+        update_readme(iter_readme_lines(platforms_by_category, category_counts))
     except Exception as e:
         logger.error(f"Error in main execution: {str(e)}")
         sys.exit(1)